@@ -0,0 +1,155 @@
+import streamlit as st
+import math
+import numpy as np
+
+FACTORS = ('Age>65','FPG>6.1','GGT','Waist','FLI>24.7','mFIB4>3.05','NLR>1.97')
+COEFFS = np.array([0.748, 0.903, 0.510, 0.721, 0.589, 0.731, 0.458])
+INTERCEPT = -3.089
+
+# Fatty Liver Index weights for log(triglycerides), BMI, log(GGT) and waist, and
+# the mFIB-4 scale factor. Shared by compute_risk and both score_batch paths.
+FLI_COEFFS = (0.953, 0.139, 0.718, 0.053)
+FLI_INTERCEPT = -15.745
+MFIB4_SCALE = 10.0
+
+# Factor thresholds, row 0 for female and row 1 for male patients; only the GGT
+# and waist cut-offs differ between the two.
+THRESHOLDS = np.array([
+    [65, 6.1, 32.0, 88.493, 24.7, 3.05, 1.97],
+    [65, 6.1, 50.0, 93.4, 24.7, 3.05, 1.97],
+])
+
+# The risk probability depends only on the seven binary factors, so evaluate the
+# logistic model once for every bitmask (bit i set <=> factor i present).
+_bits = np.unpackbits(np.arange(128, dtype=np.uint8)[:, None], axis=1, bitorder='little')[:, :7]
+PROB_TABLE = 1.0 / (1.0 + np.exp(-(INTERCEPT + _bits @ COEFFS)))
+
+# Radar chart builder. With seven binary factors there are only 128 distinct
+# inputs, so the figure is cached and shared across reruns and sessions.
+@st.cache_resource(max_entries=1024)
+def build_radar_fig(values):
+    # Kept local to the only Plotly figure builder; streamlit already loads plotly,
+    # so this does not change startup time.
+    import plotly.graph_objects as go
+
+    radar = go.Figure(go.Scatterpolar(r=list(values)+[values[0]], theta=FACTORS+(FACTORS[0],), fill='toself'))
+    radar.update_layout(width=600, height=500, polar=dict(radialaxis=dict(range=[0,1])), showlegend=False)
+    return radar
+
+# Probability bar on a fixed 0-100 axis so a low risk does not fill the chart.
+@st.cache_resource(max_entries=1024)
+def build_prob_chart(prob):
+    import altair as alt
+    import pandas as pd
+
+    data = pd.DataFrame({"label": ["Risk Probability"], "risk": [prob*100], "text": [f"{prob*100:.1f}%"]})
+    base = alt.Chart(data).encode(
+        x=alt.X("label:N", title=None),
+        y=alt.Y("risk:Q", title="Risk %", scale=alt.Scale(domain=[0, 100])),
+    )
+    return base.mark_bar() + base.mark_text(dy=-8).encode(text="text:N")
+
+# Contribution bars in model factor order (as in the radar), each labelled with
+# its value.
+@st.cache_resource(max_entries=1024)
+def build_contrib_chart(values):
+    import altair as alt
+    import pandas as pd
+
+    contrib = (COEFFS * np.array(values)).tolist()
+    data = pd.DataFrame({"factor": FACTORS, "contribution": contrib, "text": [f"{c:.2f}" for c in contrib]})
+    base = alt.Chart(data).encode(
+        x=alt.X("contribution:Q", title="Contribution"),
+        y=alt.Y("factor:N", title=None, sort=list(FACTORS)),
+    )
+    return base.mark_bar() + base.mark_text(align="left", dx=3).encode(text="text:N")
+
+@st.cache_data(max_entries=1024)
+def compute_risk(age, fpg, ggt, waist, bmi, triglycerides, nlr, ast, alt, platelet, gender) -> dict:
+    # Compute indices
+    logit_fli = (FLI_COEFFS[0] * math.log(triglycerides) + FLI_COEFFS[1] * bmi
+                 + FLI_COEFFS[2] * math.log(ggt) + FLI_COEFFS[3] * waist + FLI_INTERCEPT)
+    fli = 100.0 / (1.0 + math.exp(-logit_fli))
+    mfib4 = MFIB4_SCALE * age * ast / (platelet * alt)
+
+    # Binary encoding against the gender-specific thresholds
+    thr = THRESHOLDS[int(gender == "Male")]
+    vals = np.array([age, fpg, ggt, waist, fli, mfib4, nlr])
+    x = (vals > thr).astype(np.uint8)
+
+    # Calculate risk
+    idx = int(np.packbits(x, bitorder='little')[0])
+    prob = float(PROB_TABLE[idx])
+
+    return {
+        "fli": fli,
+        "mfib4": mfib4,
+        "prob": prob,
+        "waist_thresh": float(thr[3]),
+        "ggt_thresh": float(thr[2]),
+        "x": tuple(x.tolist()),
+        "contrib": tuple((COEFFS * x).tolist()),
+    }
+
+# Batch scoring for cohorts. Each row of x holds
+# (age, fpg, ggt, waist, bmi, triglycerides, nlr, ast, alt, platelet, male),
+# with male = 1.0 for male patients and 0.0 for female ones. Rows with a missing
+# or infinite value, or a non-positive triglycerides/GGT/ALT/platelet value (which
+# are logged or divided by), score NaN. Call score_batch(); get_score_batch()
+# picks the implementation, JIT-compiling the row loop when numba is installed
+# and otherwise falling back to the numpy-broadcast version.
+def _score_batch_loop(x):
+    n = x.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        age, fpg, ggt, waist, bmi, triglycerides, nlr, ast, alt, platelet, male = (
+            x[i, 0], x[i, 1], x[i, 2], x[i, 3], x[i, 4], x[i, 5],
+            x[i, 6], x[i, 7], x[i, 8], x[i, 9], x[i, 10],
+        )
+        if not (np.all(np.isfinite(x[i])) and triglycerides > 0 and ggt > 0 and alt > 0 and platelet > 0):
+            out[i] = np.nan
+            continue
+        logit_fli = (FLI_COEFFS[0] * np.log(triglycerides) + FLI_COEFFS[1] * bmi
+                     + FLI_COEFFS[2] * np.log(ggt) + FLI_COEFFS[3] * waist + FLI_INTERCEPT)
+        fli = 100.0 / (1.0 + np.exp(-logit_fli))
+        mfib4 = MFIB4_SCALE * age * ast / (platelet * alt)
+        vals = (age, fpg, ggt, waist, fli, mfib4, nlr)
+        thr = THRESHOLDS[1 if male > 0 else 0]
+        idx = 0
+        for j in range(7):
+            if vals[j] > thr[j]:
+                idx |= 1 << j
+        out[i] = PROB_TABLE[idx]
+    return out
+
+def _score_batch_numpy(x):
+    age, fpg, ggt, waist, bmi, triglycerides, nlr, ast, alt, platelet, male = x.T
+    valid = np.isfinite(x).all(axis=1) & (triglycerides > 0) & (ggt > 0) & (alt > 0) & (platelet > 0)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        logit_fli = (FLI_COEFFS[0] * np.log(triglycerides) + FLI_COEFFS[1] * bmi
+                     + FLI_COEFFS[2] * np.log(ggt) + FLI_COEFFS[3] * waist + FLI_INTERCEPT)
+        fli = 100.0 / (1.0 + np.exp(-logit_fli))
+        mfib4 = MFIB4_SCALE * age * ast / (platelet * alt)
+    vals = np.stack([age, fpg, ggt, waist, fli, mfib4, nlr], axis=1)
+    bits = vals > THRESHOLDS[(male > 0).astype(np.intp)]
+    return np.where(valid, PROB_TABLE[bits @ (1 << np.arange(7))], np.nan)
+
+# Numba is imported here rather than at module top so the interactive app, which
+# never scores batches, does not pay for it. Compilation (or loading the on-disk
+# compilation) then happens once per process.
+@st.cache_resource
+def get_score_batch():
+    try:
+        from numba import njit
+    except ImportError:
+        return _score_batch_numpy
+    # No fastmath: it assumes finite inputs, which the NaN handling relies on.
+    jitted = njit(cache=True, error_model='numpy')(_score_batch_loop)
+    jitted(np.ones((1, 11)))
+    return jitted
+
+def score_batch(x):
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if x.ndim != 2 or x.shape[1] != 11:
+        raise ValueError(f"score_batch expects an (N, 11) array, got shape {x.shape}")
+    return get_score_batch()(x)
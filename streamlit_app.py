@@ -1,10 +1,5 @@
 import streamlit as st
-import numpy as np
-import plotly.graph_objects as go
-# from xhtml2pdf import pisa
-from io import BytesIO
-import base64
-from datetime import datetime
+from risk_core import compute_risk, build_radar_fig, build_prob_chart, build_contrib_chart
 
 # Configure page
 st.set_page_config(page_title="FPD Risk Assessment", layout="centered")
@@ -37,57 +32,40 @@ with st.form("clinical_form"):
         platelet = st.number_input("Platelet Count (10⁹/L)", 10.0, 1000.0, 200.0)
     submit = st.form_submit_button("Calculate Risk")
 
-if not submit:
+if not submit and "last_result" not in st.session_state:
     st.stop()
 
-# Compute indices
-logit_fli = 0.953 * np.log(triglycerides) + 0.139 * bmi + 0.718 * np.log(ggt) + 0.053 * waist - 15.745
-fli = np.exp(logit_fli) / (1 + np.exp(logit_fli)) * 100
-mfib4 = 10 * age * ast / (platelet * alt)
-
-# Gender-specific thresholds
-waist_thresh = 93.4 if gender == "Male" else 88.493
-ggt_thresh = 50.0 if gender == "Male" else 32.0
-
-# Binary encoding
-x = [age > 65, fpg > 6.1, ggt > ggt_thresh, waist > waist_thresh, fli > 24.7, mfib4 > 3.05, nlr > 1.97]
-coeffs = [0.748, 0.903, 0.510, 0.721, 0.589, 0.731, 0.458]
-
-# Calculate risk
-intercept = -3.089
-logit_p = intercept + sum(c * v for c, v in zip(coeffs, x))
-prob = 1 / (1 + np.exp(-logit_p))
+# Form widgets keep their last submitted values, so reruns triggered outside the
+# form keep showing the latest results instead of clearing the page. The result
+# is only recomputed when the inputs actually changed.
+key = (age, fpg, ggt, waist, bmi, triglycerides, nlr, ast, alt, platelet, gender)
+if st.session_state.get("last_key") != key:
+    st.session_state["last_key"] = key
+    st.session_state["last_result"] = compute_risk(*key)
+r = st.session_state["last_result"]
+x = r["x"]
 
 # Display results
 st.subheader("Results")
-st.write(f"FLI: {fli:.2f}")
-st.write(f"mFIB-4: {mfib4:.2f}")
-st.write(f"Waist Threshold ({waist_thresh} cm): {'High' if x[3] else 'Normal'}")
-st.write(f"GGT Threshold ({ggt_thresh} U/L): {'High' if x[2] else 'Normal'}")
-st.write(f"Estimated Risk Probability: {prob*100:.1f}%")
-if prob < 0.2:
+st.write(f"FLI: {r['fli']:.2f}")
+st.write(f"mFIB-4: {r['mfib4']:.2f}")
+st.write(f"Waist Threshold ({r['waist_thresh']} cm): {'High' if x[3] else 'Normal'}")
+st.write(f"GGT Threshold ({r['ggt_thresh']} U/L): {'High' if x[2] else 'Normal'}")
+st.write(f"Estimated Risk Probability: {r['prob']*100:.1f}%")
+if r["prob"] < 0.2:
     st.success("Low risk")
-elif prob < 0.5:
+elif r["prob"] < 0.5:
     st.warning("Moderate risk")
 else:
     st.error("High risk")
 
-# Visualizations
-factors = ['Age>65','FPG>6.1','GGT','Waist','FLI>24.7','mFIB4>3.05','NLR>1.97']
-values = list(map(int, x))
-
-st.subheader("Risk Factor Radar Chart")
-radar = go.Figure(go.Scatterpolar(r=values+[values[0]], theta=factors+[factors[0]], fill='toself'))
-radar.update_layout(polar=dict(radialaxis=dict(range=[0,1])), showlegend=False)
-st.plotly_chart(radar, use_container_width=True)
+# Visualizations (opt-in, so the default path renders text only)
+if st.checkbox("Show visualizations", value=False):
+    st.subheader("Risk Factor Radar Chart")
+    st.plotly_chart(build_radar_fig(x), width="content")
 
-st.subheader("Risk Probability Bar Chart")
-bar = go.Figure(go.Bar(x=["Risk Probability"], y=[prob*100], text=[f"{prob*100:.1f}%"], textposition='outside'))
-bar.update_layout(yaxis=dict(range=[0,100]))
-st.plotly_chart(bar, use_container_width=True)
+    st.subheader("Risk Probability Bar Chart")
+    st.altair_chart(build_prob_chart(round(r['prob'], 3)))
 
-st.subheader("Variable Contribution Chart")
-contrib = [c * v for c, v in zip(coeffs, values)]
-chart = go.Figure(go.Bar(y=factors, x=contrib, orientation='h', text=[f"{c:.2f}" for c in contrib], textposition='outside'))
-chart.update_layout(xaxis_title="Contribution")
-st.plotly_chart(chart, use_container_width=True)
+    st.subheader("Variable Contribution Chart")
+    st.altair_chart(build_contrib_chart(x))
@@ -0,0 +1,81 @@
+import sys
+
+import numpy as np
+import pytest
+
+import risk_core
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setitem(sys.modules, "numba", None)
+    risk_core.get_score_batch.clear()
+    yield request.param
+    risk_core.get_score_batch.clear()
+
+
+def random_cohort(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([
+        rng.uniform(20, 90, n),     # age
+        rng.uniform(3, 9, n),       # fpg
+        rng.uniform(10, 120, n),    # ggt
+        rng.uniform(60, 120, n),    # waist
+        rng.uniform(15, 40, n),     # bmi
+        rng.uniform(50, 500, n),    # triglycerides
+        rng.uniform(0.5, 4, n),     # nlr
+        rng.uniform(10, 80, n),     # ast
+        rng.uniform(10, 80, n),     # alt
+        rng.uniform(80, 400, n),    # platelet
+        rng.integers(0, 2, n),      # male
+    ])
+
+
+def test_score_batch_matches_compute_risk(backend):
+    x = random_cohort()
+    expected = [
+        risk_core.compute_risk(*row[:10], "Male" if row[10] else "Female")["prob"]
+        for row in x
+    ]
+    np.testing.assert_array_equal(risk_core.score_batch(x), expected)
+
+
+def test_score_batch_invalid_rows_are_nan(backend):
+    x = np.array([
+        [50, 5.5, 30.0, 85.0, 23.0, 150.0, 1.5, 20.0, 25.0, 200.0, 1.0],
+        [70, 7.0, 60.0, 100.0, 30.0, np.nan, 2.5, 60.0, 20.0, 100.0, 1.0],
+        [70, 7.0, 60.0, 100.0, 30.0, 300.0, 2.5, 60.0, 20.0, 0.0, 0.0],
+        [70, 7.0, 60.0, 100.0, 30.0, 300.0, np.inf, 60.0, 20.0, 100.0, 0.0],
+    ])
+    out = risk_core.score_batch(x)
+    assert np.isfinite(out[0])
+    assert np.isnan(out[1:]).all()
+    # Row by row as well, so an error on one row cannot hide behind the others.
+    for row, expected in zip(x, out):
+        np.testing.assert_array_equal(risk_core.score_batch(row[None]), [expected])
+
+
+def test_score_batch_backends_agree():
+    pytest.importorskip("numba")
+    x = random_cohort(seed=1)
+    x[::7, 5] = np.nan
+    x[3::11, 9] = 0.0
+    risk_core.get_score_batch.clear()
+    jitted = risk_core.get_score_batch()
+    risk_core.get_score_batch.clear()
+    np.testing.assert_array_equal(jitted(x), risk_core._score_batch_numpy(x))
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float32])
+def test_score_batch_converts_dtype(backend, dtype):
+    x = np.array([[70, 7, 60, 100, 30, 300, 3, 60, 20, 100, 1]])
+    np.testing.assert_array_equal(risk_core.score_batch(x.astype(dtype)), risk_core.score_batch(x))
+
+
+@pytest.mark.parametrize("shape", [(3, 10), (11,), (1, 3, 11)])
+def test_score_batch_rejects_bad_shape(backend, shape):
+    with pytest.raises(ValueError):
+        risk_core.score_batch(np.ones(shape))